@@ -1,29 +1,93 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import functools
+import hashlib
 import os
 import sys
 import subprocess
 import shlex
 import shutil
 import platform
+import stat
+import tarfile
+import threading
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 ROOT = Path(__file__).resolve().parents[1]
 DEPS = ROOT / "third_party"
 DEPOT_TOOLS = DEPS / "depot_tools"
 V8_DIR = DEPS / "v8"
+BUILD_CACHE = ROOT / ".v8cache"
+# 1980-01-01, the earliest timestamp a ZIP entry can hold.
+_ZIP_MIN_MTIME = 315532800
+# Linux FICLONE ioctl (_IOW(0x94, 9, int)): share extents with the source file.
+_FICLONE = 0x40049409
+_COPY_CHUNK = 1 << 20
+
+# Cleanup threads started by _remove_in_background().
+_BACKGROUND_REMOVALS: list[threading.Thread] = []
+
+# Only the host's naming convention can appear in a given build output.
+_MONOLITH_LIB_NAME = {
+    "Windows": "v8_monolith.lib",
+    "Darwin": "libv8_monolith.a",
+    "Linux": "libv8_monolith.a",
+}
+
+def _scan_path_windows(cmd: str, path: str) -> str | None:
+    # One directory listing per PATH entry instead of a stat per PATHEXT variant.
+    pathext = [ext.lower() for ext in os.environ.get("PATHEXT", ".COM;.EXE;.BAT;.CMD").split(os.pathsep) if ext]
+    lowered = cmd.lower()
+    if any(lowered.endswith(ext) for ext in pathext):
+        candidates = [lowered]
+    else:
+        candidates = [lowered + ext for ext in pathext]
+    wanted = set(candidates)
+
+    for directory in path.split(os.pathsep):
+        if not directory:
+            continue
+        try:
+            with os.scandir(directory) as entries:
+                found = {
+                    entry.name.lower(): entry.path
+                    for entry in entries
+                    if entry.name.lower() in wanted and not entry.is_dir()
+                }
+        except OSError:
+            continue
+        for name in candidates:
+            if name in found:
+                return found[name]
+    return None
 
-def run(cmd, cwd=None, env=None):
+
+@functools.lru_cache(maxsize=None)
+def _which(cmd: str, path_key: str) -> str | None:
+    if os.name == "nt" and not os.path.dirname(cmd):
+        return _scan_path_windows(cmd, path_key)
+    return shutil.which(cmd, path=path_key)
+
+def _env_path(env_overrides: dict | None) -> str:
+    if env_overrides and "PATH" in env_overrides:
+        return env_overrides["PATH"]
+    return os.environ.get("PATH", "")
+
+def run(cmd, cwd=None, env_overrides=None):
     print(">", " ".join(cmd))
     exec_cmd = cmd
     if os.name == "nt" and isinstance(cmd, (list, tuple)) and cmd:
         # Resolve batch files on Windows because CreateProcess cannot execute them directly.
-        search_path = env.get("PATH") if env else None
-        resolved = shutil.which(cmd[0], path=search_path)
+        resolved = _which(cmd[0], _env_path(env_overrides))
         if resolved is None:
             raise FileNotFoundError(f"Command {cmd[0]!r} not found in PATH")
         exec_cmd = [resolved, *cmd[1:]]
+    # Children inherit os.environ unless there is something to override.
+    env = {**os.environ, **env_overrides} if env_overrides else None
     subprocess.check_call(exec_cmd, cwd=cwd, env=env)
 
 def ensure_submodules():
@@ -32,33 +96,32 @@ def ensure_submodules():
         sys.exit(1)
 
 
+# GN target CPU prefix (e.g. "arm64" in "arm64.release") -> Rust triple architecture.
+_ARCH_BY_PREFIX = {
+    "x64": "x86_64",
+    "x86": "i686",
+    "ia32": "i686",
+    "arm64": "aarch64",
+    "arm": "aarch64",
+}
+
+# Host OS -> Rust triple vendor/OS suffix; other hosts default to Linux triples.
+_OS_TRIPLE = {
+    "windows": "pc-windows-msvc",
+    "darwin": "apple-darwin",
+    "linux": "unknown-linux-gnu",
+}
+
 def infer_default_target_triple(gn_target: str) -> str:
-    host = platform.system().lower()
-    target_lower = gn_target.lower()
-
-    def has_any(*needles):
-        return any(n in target_lower for n in needles)
-
-    if host == "windows":
-        if has_any("arm64", "arm"):
-            return "aarch64-pc-windows-msvc"
-        if has_any("x86", "ia32") and not has_any("64"):
-            return "i686-pc-windows-msvc"
-        return "x86_64-pc-windows-msvc"
-    if host == "darwin":
-        if has_any("arm64", "m1", "m2", "m3", "mac-arm"):
-            return "aarch64-apple-darwin"
-        return "x86_64-apple-darwin"
-    # Default to Linux triples for other hosts.
-    if has_any("arm64", "arm"):
-        return "aarch64-unknown-linux-gnu"
-    if has_any("x86", "ia32") and not has_any("64"):
-        return "i686-unknown-linux-gnu"
-    return "x86_64-unknown-linux-gnu"
-
-def find_librarian(env: dict) -> Path | None:
-    for candidate in ("lib.exe", "llvm-lib.exe"):
-        path = shutil.which(candidate, path=env.get("PATH"))
+    prefix = gn_target.split(".", 1)[0].lower()
+    arch = _ARCH_BY_PREFIX.get(prefix, "x86_64")
+    os_triple = _OS_TRIPLE.get(platform.system().lower(), "unknown-linux-gnu")
+    return f"{arch}-{os_triple}"
+
+def find_librarian(env_overrides: dict | None) -> Path | None:
+    # Prefer llvm-lib: it builds the archive symbol table considerably faster than lib.exe.
+    for candidate in ("llvm-lib.exe", "lib.exe"):
+        path = _which(candidate, _env_path(env_overrides))
         if path:
             return Path(path)
 
@@ -67,30 +130,40 @@ def find_librarian(env: dict) -> Path | None:
         return fallback
     return None
 
-def bundle_libcxx(outdir: Path, env: dict) -> Path | None:
+def bundle_libcxx(outdir: Path, env_overrides: dict | None) -> Path | None:
     obj_dir = outdir / "obj" / "buildtools" / "third_party" / "libc++" / "libc++"
     if not obj_dir.exists():
         return None
 
-    objects = sorted(obj_dir.glob("*.obj"))
+    # One directory pass; DirEntry.stat() is served from the listing on Windows.
+    objects = []
+    newest = 0.0
+    with os.scandir(obj_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith(".obj"):
+                objects.append(entry.path)
+                newest = max(newest, entry.stat().st_mtime)
     if not objects:
         return None
 
-    librarian = find_librarian(env)
+    target = obj_dir.parent / "v8_libcxx.lib"
+    if target.exists() and target.stat().st_mtime >= newest:
+        print("libc++ bundle is up to date:", target)
+        return target
+
+    librarian = find_librarian(env_overrides)
     if librarian is None:
         print("Warning: Could not find lib.exe or llvm-lib.exe; libc++ will not be bundled.")
         return None
 
-    target = obj_dir.parent / "v8_libcxx.lib"
+    objects.sort()
     rsp_path = obj_dir.parent / "libcxx.rsp"
 
-    with open(rsp_path, "w", encoding="utf-8", newline="") as rsp:
-        rsp.write("/nologo\n")
-        rsp.write(f"/OUT:\"{target}\"\n")
-        for obj in objects:
-            rsp.write(f"\"{obj}\"\n")
+    lines = ["/nologo\n", f"/OUT:\"{target}\"\n"]
+    lines.extend(f"\"{obj}\"\n" for obj in objects)
+    rsp_path.write_text("".join(lines), encoding="utf-8", newline="")
 
-    run([str(librarian), f"@{rsp_path}"], cwd=outdir, env=env)
+    run([str(librarian), f"@{rsp_path}"], cwd=outdir, env_overrides=env_overrides)
 
     try:
         rsp_path.unlink()
@@ -100,7 +173,25 @@ def bundle_libcxx(outdir: Path, env: dict) -> Path | None:
     return target if target.exists() else None
 
 
-def ensure_sysroot(target: str, python_exe: str, env: dict) -> None:
+# install-sysroot.py --arch value -> Debian architecture in the sysroot directory name.
+_SYSROOT_DEBIAN_ARCH = {
+    "arm64": "arm64",
+    "arm": "armhf",
+    "i386": "i386",
+}
+
+def _sysroot_is_current(sysroot_script: Path, arch: str) -> bool:
+    # install-sysroot.py leaves build/linux/debian_<release>_<arch>-sysroot/.stamp behind. The pinned
+    # tarball hashes live in sysroots.json, which gclient sync rewrites whenever the sysroot changes.
+    inputs = [sysroot_script, sysroot_script.with_name("sysroots.json")]
+    newest_input = max(p.stat().st_mtime for p in inputs if p.exists())
+    linux_dir = sysroot_script.parent.parent
+    for stamp in linux_dir.glob(f"debian_*_{_SYSROOT_DEBIAN_ARCH[arch]}-sysroot/.stamp"):
+        if stamp.stat().st_mtime > newest_input:
+            return True
+    return False
+
+def ensure_sysroot(target: str, python_exe: str, env_overrides: dict | None) -> None:
     if platform.system() != "Linux":
         return
 
@@ -119,82 +210,202 @@ def ensure_sysroot(target: str, python_exe: str, env: dict) -> None:
     sysroot_script = V8_DIR / "build" / "linux" / "sysroot_scripts" / "install-sysroot.py"
     if not sysroot_script.exists():
         return
+    if _sysroot_is_current(sysroot_script, arch):
+        print(f"Sysroot for {arch} is up to date; skipping install-sysroot.py")
+        return
+
+    run([python_exe, str(sysroot_script), f"--arch={arch}"], cwd=V8_DIR, env_overrides=env_overrides)
 
-    run([python_exe, str(sysroot_script), f"--arch={arch}"], cwd=V8_DIR, env=env)
+# GN args required for the packaged monolith; user-supplied GN_ARGS take precedence.
+_DEFAULT_GN_ARGS = (
+    ("v8_monolithic", "true"),
+    ("is_component_build", "false"),
+    ("v8_use_external_startup_data", "false"),
+    ("treat_warnings_as_errors", "false"),
+    ("use_clang_modules", "false"),
+)
+
+def _default_gn_args(extra_args_raw: str) -> list[str]:
+    extra_args_list = shlex.split(extra_args_raw) if extra_args_raw else []
+    for prefix, value in _DEFAULT_GN_ARGS:
+        key = f"{prefix}="
+        if not any(arg.startswith(key) for arg in extra_args_list):
+            extra_args_list.append(f"{key}{value}")
+    return extra_args_list
+
+def _has_jobserver(makeflags: str) -> bool:
+    return "--jobserver-auth" in makeflags or "--jobserver-fds" in makeflags
 
 def build_v8(target="x64.release", revision: str | None = None):
-    env = os.environ.copy()
-    # Make depot_tools available in PATH
-    env["PATH"] = str(DEPOT_TOOLS) + os.pathsep + env.get("PATH", "")
-    # Avoid authenticated toolchain downloads; rely on locally installed VS toolchain instead.
-    env.setdefault("DEPOT_TOOLS_WIN_TOOLCHAIN", "0")
-    vpython = shutil.which("vpython3", path=env.get("PATH")) or shutil.which("vpython", path=env.get("PATH"))
+    env_overrides = {
+        # Make depot_tools available in PATH
+        "PATH": str(DEPOT_TOOLS) + os.pathsep + os.environ.get("PATH", ""),
+        # Avoid authenticated toolchain downloads; rely on locally installed VS toolchain instead.
+        "DEPOT_TOOLS_WIN_TOOLCHAIN": os.environ.get("DEPOT_TOOLS_WIN_TOOLCHAIN", "0"),
+    }
+    path = env_overrides["PATH"]
+    vpython = _which("vpython3", path) or _which("vpython", path)
     python_exe = vpython or sys.executable
     # sync (in case)
     sync_cmd = ["gclient", "sync"]
     if revision:
-        run(["git", "fetch", "origin"], cwd=V8_DIR, env=env)
+        run(["git", "fetch", "origin"], cwd=V8_DIR, env_overrides=env_overrides)
         sync_cmd.append(f"--revision=src/v8@{revision}")
-    run(sync_cmd, cwd=V8_DIR, env=env)
+    run(sync_cmd, cwd=V8_DIR, env_overrides=env_overrides)
     # generate build (ensure v8_monolithic is available)
-    extra_args_raw = env.get("GN_ARGS", "")
-    extra_args_list = shlex.split(extra_args_raw) if extra_args_raw else []
-
-    def ensure_arg(prefix, value):
-        key = f"{prefix}="
-        if not any(arg.startswith(key) for arg in extra_args_list):
-            extra_args_list.append(f"{key}{value}")
-
-    ensure_arg("v8_monolithic", "true")
-    ensure_arg("is_component_build", "false")
-    ensure_arg("v8_use_external_startup_data", "false")
-    ensure_arg("treat_warnings_as_errors", "false")
-    ensure_arg("use_clang_modules", "false")
-
-    env["GN_ARGS"] = " ".join(extra_args_list)
+    extra_args_list = _default_gn_args(os.environ.get("GN_ARGS", ""))
+    env_overrides["GN_ARGS"] = " ".join(extra_args_list)
 
-    ensure_sysroot(target, python_exe, env)
+    # install-sysroot.py lives in the build/ dependency that gclient sync updates.
+    ensure_sysroot(target, python_exe, env_overrides)
 
     v8gen_cmd = [python_exe, "tools/dev/v8gen.py", "-vv", target]
     if extra_args_list:
         v8gen_cmd.append("--")
         v8gen_cmd.extend(extra_args_list)
-    run(v8gen_cmd, cwd=V8_DIR, env=env)
+    run(v8gen_cmd, cwd=V8_DIR, env_overrides=env_overrides)
     # ninja build
     outdir = V8_DIR / f"out.gn/{target}"
+    ninja_cmd = ["ninja", "-C", str(outdir)]
+    # MAKEFLAGS is inherited from the parent environment on purpose. When a parent make/ninja
+    # advertises a jobserver, leave -j/-l unset so ninja's jobserver client takes its slots.
+    if not _has_jobserver(os.environ.get("MAKEFLAGS", "")):
+        cpus = os.cpu_count() or 1
+        jobs = int(os.environ.get("V8_NINJA_JOBS") or max(1, cpus - 1))
+        ninja_cmd.extend(["-j", str(jobs), "-l", str(cpus)])
     # Build monolith plus platform/base support libraries (names consistent across platforms)
-    run(["ninja", "-C", str(outdir), "v8_monolith", "v8_libplatform", "v8_libbase"], cwd=V8_DIR, env=env)
-    return outdir, env
+    ninja_cmd.extend(["v8_monolith", "v8_libplatform", "v8_libbase"])
+    run(ninja_cmd, cwd=V8_DIR, env_overrides=env_overrides)
+    return outdir, env_overrides
+
+def _link_tree(src: Path, dst: Path) -> None:
+    # Hardlinks are a single inode op per file; fall back to copying across devices.
+    for dirpath, _dirnames, filenames in os.walk(src):
+        dst_dir = dst / Path(dirpath).relative_to(src)
+        os.makedirs(dst_dir, exist_ok=True)
+        for name in filenames:
+            src_file = os.path.join(dirpath, name)
+            dst_file = dst_dir / name
+            try:
+                os.link(src_file, dst_file)
+            except OSError:
+                shutil.copy2(src_file, dst_file)
+
+def _clone_or_copy(src: Path, dst: Path) -> None:
+    # shutil.copy on Linux still pushes every byte through the page cache. Prefer a reflink
+    # (btrfs/xfs), then an in-kernel copy_file_range, then a plain buffered copy.
+    if not sys.platform.startswith("linux"):
+        shutil.copy(src, dst)
+        return
+
+    import fcntl
+
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        try:
+            fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+        except OSError:
+            try:
+                while os.copy_file_range(fsrc.fileno(), fdst.fileno(), _COPY_CHUNK):
+                    pass
+            except OSError:
+                # Both descriptors sit at the same offset, so finish from wherever the kernel stopped.
+                shutil.copyfileobj(fsrc, fdst, _COPY_CHUNK)
+    shutil.copymode(src, dst)
+
+def _remove_in_background(path: Path) -> None:
+    # Unlinking a previous package (include/ tree plus the monolith) takes a while; keep it off
+    # the critical path. main() joins these threads before exiting.
+    thread = threading.Thread(target=shutil.rmtree, args=(path,), kwargs={"ignore_errors": True})
+    thread.start()
+    _BACKGROUND_REMOVALS.append(thread)
+
+def _fresh_pkg_dir(target_triple: str) -> Path:
+    artifacts = ROOT / "artifacts"
+    artifacts.mkdir(exist_ok=True)
+    pkg_dir = artifacts / f"v8-{target_triple}"
+    if pkg_dir.exists():
+        trash = pkg_dir.with_name(f"{pkg_dir.name}.trash.{os.urandom(4).hex()}")
+        try:
+            os.replace(pkg_dir, trash)
+        except OSError:
+            # e.g. a file inside is still open on Windows; delete in place instead.
+            shutil.rmtree(pkg_dir)
+    # Also sweep trash left behind by interrupted runs.
+    for trash in artifacts.glob(f"{pkg_dir.name}.trash.*"):
+        _remove_in_background(trash)
+    pkg_dir.mkdir(parents=True)
+    return pkg_dir
+
+def _resolve_cache_revision(revision: str | None) -> str | None:
+    # Resolve to a full commit so equivalent spellings share a key. Only commit ids and tags are
+    # trusted: branch names such as main or lkgr are resolved before `git fetch` and may be stale.
+    spec = revision or "HEAD"
+    result = subprocess.run(
+        ["git", "-C", str(V8_DIR), "rev-parse", "--verify", "--quiet", f"{spec}^{{commit}}"],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        return None
+    commit = result.stdout.strip()
+    if revision is None or commit.startswith(revision.lower()):
+        return commit
+    tag = subprocess.run(
+        ["git", "-C", str(V8_DIR), "show-ref", "--verify", "--quiet", f"refs/tags/{revision}"],
+    )
+    return commit if tag.returncode == 0 else None
+
+def _build_cache_dir(target: str, revision: str | None) -> Path | None:
+    # Key on everything that changes the produced package: sources, GN args and host. The
+    # revision also pins V8's bundled clang (third_party/llvm-build), which does the compiling.
+    commit = _resolve_cache_revision(revision)
+    if commit is None:
+        print(f"Build cache disabled: {revision!r} is not a local commit id or tag.")
+        return None
+    gn_args = sorted(_default_gn_args(os.environ.get("GN_ARGS", "")))
+    key = hashlib.sha256()
+    for part in (target, commit, platform.platform(), *gn_args):
+        key.update(part.encode("utf-8"))
+        key.update(b"\0")
+    return BUILD_CACHE / key.hexdigest()[:16]
+
+def _is_cached(cache_dir: Path) -> bool:
+    return (cache_dir / "include").is_dir() and any((cache_dir / "lib").glob("*v8_monolith.*"))
+
+def _store_in_cache(pkg_dir: Path, cache_dir: Path) -> None:
+    # Stage next to the final entry so a partially linked tree is never picked up as a hit.
+    staging = cache_dir.with_name(f"{cache_dir.name}.tmp")
+    if staging.exists():
+        shutil.rmtree(staging)
+    _link_tree(pkg_dir, staging)
+    if cache_dir.exists():
+        shutil.rmtree(cache_dir)
+    os.replace(staging, cache_dir)
+    print("Stored package in build cache:", cache_dir)
+
+def package_from_cache(cache_dir: Path, target_triple: str) -> Path:
+    pkg_dir = _fresh_pkg_dir(target_triple)
+    _link_tree(cache_dir, pkg_dir)
+    print("Restored package directory from build cache:", cache_dir)
 
-def package(outdir, target_triple, env):
+    create_archives(pkg_dir)
+
+    return pkg_dir
+
+def package(outdir, target_triple, env_overrides):
     # expected artifacts:
     # outdir/obj/libv8_monolith.a  (linux)
-    lib_candidates = [
-        outdir / "obj" / "libv8_monolith.a",
-        outdir / "obj" / "v8_monolith.lib",
-        outdir / "libv8_monolith.a"
-    ]
+    lib_name = _MONOLITH_LIB_NAME.get(platform.system(), "libv8_monolith.a")
     lib_path = None
-    for p in lib_candidates:
+    for p in (outdir / "obj" / lib_name, outdir / lib_name):
         if p.exists():
             lib_path = p
             break
     if lib_path is None:
         raise RuntimeError("libv8_monolith not found in build output")
-    artifacts = ROOT / "artifacts"
-    artifacts.mkdir(exist_ok=True)
-    pkg_dir = artifacts / f"v8-{target_triple}"
-    if pkg_dir.exists():
-        shutil.rmtree(pkg_dir)
-    pkg_dir.mkdir(parents=True)
-    # Ensure unified lib/ directory containing ALL libraries (including monolith)
-    lib_subdir = pkg_dir / "lib"
-    lib_subdir.mkdir(parents=True, exist_ok=True)
-    shutil.copy(lib_path, lib_subdir / lib_path.name)
-    libcxx_lib = bundle_libcxx(outdir, env)
-    extra_libs = []
-    if libcxx_lib is not None:
-        extra_libs.append(libcxx_lib)
+    inc_src = V8_DIR / "include"
+    if not inc_src.exists():
+        raise RuntimeError("include/ not found in v8 checkout")
 
     # Collect platform/base libraries across OSes. Possible filenames differ by platform.
     platform_base_variants = [
@@ -216,33 +427,44 @@ def package(outdir, target_triple, env):
         outdir,
     ]
 
-    seen = set()
+    # Keyed by file name: when several subdirs carry the same library, the last one wins.
+    extra_libs = {}
     for subdir in candidate_subdirs:
         if not subdir.exists():
             continue
         for variant in platform_base_variants:
             path = subdir / variant
-            if path.exists() and path not in seen:
-                extra_libs.append(path)
-                seen.add(path)
-
-    if extra_libs:
-        for lib in extra_libs:
-            shutil.copy(lib, lib_subdir / lib.name)
-    icu_src = outdir / "icudtl.dat"
-    if icu_src.exists():
-        shutil.copy(icu_src, pkg_dir / "icudtl.dat")
-    else:
-        print("Warning: icudtl.dat was not found in the build output directory.")
-    config_src = outdir / "v8_build_config.json"
-    if config_src.exists():
-        shutil.copy(config_src, pkg_dir / "v8_build_config.json")
-    # copy include tree
-    inc_src = V8_DIR / "include"
-    if inc_src.exists():
-        shutil.copytree(inc_src, pkg_dir / "include")
-    else:
-        raise RuntimeError("include/ not found in v8 checkout")
+            if path.exists():
+                extra_libs[variant] = path
+
+    pkg_dir = _fresh_pkg_dir(target_triple)
+    # Ensure unified lib/ directory containing ALL libraries (including monolith)
+    lib_subdir = pkg_dir / "lib"
+    lib_subdir.mkdir(parents=True, exist_ok=True)
+
+    # The copies below are independent and I/O bound, so let them overlap with the libc++ bundling.
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        libcxx = executor.submit(bundle_libcxx, outdir, env_overrides)
+        copies = [
+            executor.submit(_clone_or_copy, lib_path, lib_subdir / lib_path.name),
+            executor.submit(_link_tree, inc_src, pkg_dir / "include"),
+        ]
+        for name, lib in extra_libs.items():
+            copies.append(executor.submit(_clone_or_copy, lib, lib_subdir / name))
+        icu_src = outdir / "icudtl.dat"
+        if icu_src.exists():
+            copies.append(executor.submit(_clone_or_copy, icu_src, pkg_dir / "icudtl.dat"))
+        else:
+            print("Warning: icudtl.dat was not found in the build output directory.")
+        config_src = outdir / "v8_build_config.json"
+        if config_src.exists():
+            copies.append(executor.submit(_clone_or_copy, config_src, pkg_dir / "v8_build_config.json"))
+
+        libcxx_lib = libcxx.result()
+        if libcxx_lib is not None:
+            copies.append(executor.submit(_clone_or_copy, libcxx_lib, lib_subdir / libcxx_lib.name))
+        for copy in copies:
+            copy.result()
     print("Created package directory:", pkg_dir)
 
     # Produce both tar.gz and zip archives for CI release stages.
@@ -251,23 +473,105 @@ def package(outdir, target_triple, env):
     return pkg_dir
 
 
-def create_archives(pkg_dir: Path) -> None:
-    base_name = str(pkg_dir)
-    root_dir = pkg_dir.parent
-    base_dir = pkg_dir.name
+class _TeeReader:
+    """File wrapper that mirrors every chunk read from ``src`` into ``sink``."""
 
-    archives = [
-        ("gztar", Path(f"{base_name}.tar.gz")),
-        ("zip", Path(f"{base_name}.zip")),
-    ]
+    def __init__(self, src, sink):
+        self._src = src
+        self._sink = sink
+
+    def read(self, size=-1):
+        data = self._src.read(size)
+        self._sink.write(data)
+        return data
 
-    for _fmt, archive_path in archives:
+
+def _zip_info(arcname: str, info: tarfile.TarInfo) -> zipfile.ZipInfo:
+    # ZIP timestamps cannot predate 1980; clamp like make_archive does.
+    mtime = max(info.mtime, _ZIP_MIN_MTIME)
+    zinfo = zipfile.ZipInfo(arcname, time.localtime(mtime)[:6])
+    if info.isdir():
+        zinfo.external_attr = ((stat.S_IFDIR | stat.S_IMODE(info.mode)) << 16) | 0x10
+    else:
+        zinfo.external_attr = (stat.S_IFREG | stat.S_IMODE(info.mode)) << 16
+        zinfo.compress_type = zipfile.ZIP_DEFLATED
+        zinfo.file_size = info.size
+    return zinfo
+
+
+def _write_archives(pkg_dir: Path, tar_path: Path, zip_path: Path) -> None:
+    # Walk the package once and feed each file to both archives from a single read.
+    with open(tar_path, "wb") as tar_out, \
+            tarfile.open(fileobj=tar_out, mode="w|gz") as tar_file, \
+            zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_DEFLATED) as zip_file:
+        for dirpath, dirnames, filenames in os.walk(pkg_dir):
+            dirnames.sort()
+            rel_dir = Path(dirpath).relative_to(pkg_dir.parent).as_posix()
+            info = tar_file.gettarinfo(dirpath, arcname=rel_dir)
+            tar_file.addfile(info)
+            zip_file.writestr(_zip_info(f"{rel_dir}/", info), b"")
+            for name in sorted(filenames):
+                arcname = f"{rel_dir}/{name}"
+                with open(os.path.join(dirpath, name), "rb") as src:
+                    info = tar_file.gettarinfo(arcname=arcname, fileobj=src)
+                    with zip_file.open(_zip_info(arcname, info), "w") as zip_dst:
+                        tar_file.addfile(info, _TeeReader(src, zip_dst))
+
+
+def _make_targz(pkg_dir: Path, out_path: Path, pigz: str, tar: str) -> None:
+    # tar | pigz compresses with one DEFLATE lane per core instead of tarfile's single thread.
+    with open(out_path, "wb") as out:
+        tar_proc = subprocess.Popen(
+            [tar, "-C", str(pkg_dir.parent), "-cf", "-", pkg_dir.name],
+            stdout=subprocess.PIPE,
+        )
+        pigz_proc = subprocess.Popen(
+            [pigz, "-n", "-p", str(os.cpu_count() or 1)],
+            stdin=tar_proc.stdout,
+            stdout=out,
+        )
+        # Let tar receive SIGPIPE if pigz exits early.
+        tar_proc.stdout.close()
+        pigz_rc = pigz_proc.wait()
+        tar_rc = tar_proc.wait()
+    if tar_rc != 0 or pigz_rc != 0:
+        out_path.unlink(missing_ok=True)
+        raise RuntimeError(f"tar | pigz failed (tar={tar_rc}, pigz={pigz_rc})")
+
+
+def _make_zip(pkg_dir: Path, out_path: Path) -> None:
+    seven_zip = _which("7z", os.environ.get("PATH", ""))
+    if seven_zip:
+        # 7z compresses zip entries on all cores with -mmt=on.
+        subprocess.check_call(
+            [seven_zip, "a", "-tzip", "-mmt=on", "-bd", str(out_path), pkg_dir.name],
+            cwd=pkg_dir.parent,
+            stdout=subprocess.DEVNULL,
+        )
+        return
+
+    shutil.make_archive(str(out_path.with_suffix("")), "zip", root_dir=pkg_dir.parent, base_dir=pkg_dir.name)
+
+
+def create_archives(pkg_dir: Path) -> None:
+    tar_path = pkg_dir.with_name(f"{pkg_dir.name}.tar.gz")
+    zip_path = pkg_dir.with_name(f"{pkg_dir.name}.zip")
+
+    for archive_path in (tar_path, zip_path):
         if archive_path.exists():
             archive_path.unlink()
 
-    for fmt, _archive_path in archives:
-        created = shutil.make_archive(base_name, fmt, root_dir=root_dir, base_dir=base_dir)
-        print("Created archive:", created)
+    pigz = _which("pigz", os.environ.get("PATH", ""))
+    tar = _which("tar", os.environ.get("PATH", ""))
+    if pigz and tar:
+        _make_targz(pkg_dir, tar_path, pigz, tar)
+        _make_zip(pkg_dir, zip_path)
+    else:
+        # Pure-Python path (e.g. Windows hosts without pigz).
+        _write_archives(pkg_dir, tar_path, zip_path)
+
+    for archive_path in (tar_path, zip_path):
+        print("Created archive:", archive_path)
 
 def main():
     ensure_submodules()
@@ -276,9 +580,19 @@ def main():
     gn_target = os.environ.get("GN_TARGET", "x64.release")
     target_triple = os.environ.get("TARGET_TRIPLE", infer_default_target_triple(gn_target))
     revision = os.environ.get("V8_GIT_REVISION")
-    outdir, env = build_v8(gn_target, revision)
-    pkg = package(outdir, target_triple, env)
+    cache_dir = None
+    if os.environ.get("V8_BUILD_CACHE") == "1":
+        cache_dir = _build_cache_dir(gn_target, revision)
+    if cache_dir is not None and _is_cached(cache_dir):
+        pkg = package_from_cache(cache_dir, target_triple)
+    else:
+        outdir, env_overrides = build_v8(gn_target, revision)
+        pkg = package(outdir, target_triple, env_overrides)
+        if cache_dir is not None:
+            _store_in_cache(pkg, cache_dir)
     print("Package directory:", pkg)
+    for thread in _BACKGROUND_REMOVALS:
+        thread.join()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -16,6 +16,14 @@ VERSION_TAG_RE = re.compile(r"^\d+(?:\.\d+){1,3}$")
 # numbers and optional patch components).
 MAX_RELEASE_BUILD_COMPONENT = 1_000_000
 
+# Upper bound, in seconds, for any single git invocation.
+GIT_TIMEOUT = 30
+
+VERSION_MACRO_RE = re.compile(
+    r"^#define\s+V8_(MAJOR_VERSION|MINOR_VERSION|BUILD_NUMBER|PATCH_LEVEL)\s+(\d+)",
+    re.MULTILINE,
+)
+
 
 def to_crate_version(version: str) -> str:
     parts = version.split(".")
@@ -27,50 +35,74 @@ def to_crate_version(version: str) -> str:
     return f"{base}-patch.{suffix}"
 
 
-def git_show(repo: Path, ref: str, file_path: str) -> str:
-    return subprocess.check_output(
-        ["git", "-C", str(repo), "show", f"{ref}:{file_path}"],
-        text=True,
-        stderr=subprocess.STDOUT,
-    )
-
-
-def git_rev_parse(repo: Path, ref: str) -> str:
-    return (
-        subprocess.check_output(["git", "-C", str(repo), "rev-parse", ref], text=True)
-        .strip()
-    )
+def git_cat_file(repo: Path, *objects: str) -> list[tuple[str, bytes]]:
+    # Resolve several objects through a single `git cat-file --batch` process.
+    cmd = ["git", "-C", str(repo), "cat-file", "--batch"]
+    proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    try:
+        stdout, stderr = proc.communicate(
+            "".join(f"{obj}\n" for obj in objects).encode("utf-8"),
+            timeout=GIT_TIMEOUT,
+        )
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.communicate()
+        raise
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, cmd, output=stderr.decode("utf-8", "replace"))
+
+    results = []
+    pos = 0
+    for obj in objects:
+        end = stdout.index(b"\n", pos)
+        # Each response is "<sha> <type> <size>\n<contents>\n", or "<obj> missing\n".
+        fields = stdout[pos:end].decode("utf-8").split()
+        pos = end + 1
+        if len(fields) != 3 or not fields[2].isdigit():
+            raise RuntimeError(f"Unable to resolve {obj!r} in {repo}")
+        sha, size = fields[0], int(fields[2])
+        if pos + size > len(stdout):
+            raise RuntimeError(f"Truncated git cat-file output for {obj!r}")
+        results.append((sha, stdout[pos:pos + size]))
+        pos += size + 1
+    return results
 
 
 def parse_version(header: str) -> tuple[int, int, int, int]:
-    patterns = {
-        "major": re.compile(r"^#define\\s+V8_MAJOR_VERSION\\s+(\\d+)", re.MULTILINE),
-        "minor": re.compile(r"^#define\\s+V8_MINOR_VERSION\\s+(\\d+)", re.MULTILINE),
-        "build": re.compile(r"^#define\\s+V8_BUILD_NUMBER\\s+(\\d+)", re.MULTILINE),
-        "patch": re.compile(r"^#define\\s+V8_PATCH_LEVEL\\s+(\\d+)", re.MULTILINE),
-    }
+    # Keep the first definition of each macro, matching a per-macro search().
+    values: dict[str, int] = {}
+    for match in VERSION_MACRO_RE.finditer(header):
+        values.setdefault(match.group(1), int(match.group(2)))
 
     try:
-        major = int(patterns["major"].search(header).group(1))
-        minor = int(patterns["minor"].search(header).group(1))
-        build = int(patterns["build"].search(header).group(1))
-        patch = int(patterns["patch"].search(header).group(1))
-    except (AttributeError, ValueError) as exc:
+        return (
+            values["MAJOR_VERSION"],
+            values["MINOR_VERSION"],
+            values["BUILD_NUMBER"],
+            values["PATCH_LEVEL"],
+        )
+    except KeyError as exc:
         raise RuntimeError("Unable to parse V8 version macros from header") from exc
 
-    return major, minor, build, patch
-
 
 def determine_latest_tag(repo: Path, pattern: str | None) -> tuple[str, str]:
-    cmd = ["git", "-C", str(repo), "tag", "--list", "--sort=-v:refname"]
-    if pattern:
-        cmd.append(pattern)
-
-    output = subprocess.check_output(cmd, text=True)
-    for raw_tag in output.splitlines():
-        tag = raw_tag.strip()
-        if not tag:
+    # One for-each-ref call yields each tag with its object and, for annotated tags, the peeled commit.
+    cmd = [
+        "git",
+        "-C",
+        str(repo),
+        "for-each-ref",
+        "--sort=-v:refname",
+        "--format=%(refname:lstrip=2) %(objectname) %(*objectname)",
+        f"refs/tags/{pattern}" if pattern else "refs/tags",
+    ]
+
+    output = subprocess.check_output(cmd, text=True, timeout=GIT_TIMEOUT)
+    for line in output.splitlines():
+        fields = line.split()
+        if len(fields) < 2:
             continue
+        tag = fields[0]
         if not VERSION_TAG_RE.fullmatch(tag):
             continue
         try:
@@ -82,7 +114,7 @@ def determine_latest_tag(repo: Path, pattern: str | None) -> tuple[str, str]:
         build = parts[2]
         if build >= MAX_RELEASE_BUILD_COMPONENT:
             continue
-        commit = git_rev_parse(repo, tag)
+        commit = fields[-1]
         return tag, commit
 
     raise RuntimeError("Unable to determine latest V8 tag")
@@ -100,7 +132,7 @@ def main() -> None:
     )
     parser.add_argument(
         "--tag-pattern",
-        help="Optional glob passed to `git tag --list` when --mode latest-tag is used",
+        help="Optional glob matched against tag names when --mode latest-tag is used",
     )
     parser.add_argument(
         "--output",
@@ -110,10 +142,13 @@ def main() -> None:
     args = parser.parse_args()
 
     if args.mode == "header":
-        header = git_show(args.repo, args.ref, "include/v8-version.h")
-        major, minor, build, patch = parse_version(header)
+        (_, header), (commit, _) = git_cat_file(
+            args.repo,
+            f"{args.ref}:include/v8-version.h",
+            f"{args.ref}^{{commit}}",
+        )
+        major, minor, build, patch = parse_version(header.decode("utf-8"))
         version = f"{major}.{minor}.{build}.{patch}"
-        commit = git_rev_parse(args.repo, args.ref)
     else:
         version, commit = determine_latest_tag(args.repo, args.tag_pattern)
 